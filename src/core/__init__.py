@@ -1,16 +1,24 @@
 """Core module for Entity Editor."""
-from .signal_hub import SignalHub, get_signal_hub
 from .history_manager import HistoryManager
 from .snapshot_command import EntitySnapshotCommand
 from .command import (
     Command, AddBodyPartCommand, RemoveBodyPartCommand, ModifyBodyPartCommand,
     MoveBodyPartCommand, AddHitboxCommand, RemoveHitboxCommand, 
-    ModifyHitboxCommand, MoveHitboxCommand
+    ModifyHitboxCommand, MoveHitboxCommand, FieldDeltaCommand
 )
 
 __all__ = [
     'SignalHub', 'get_signal_hub', 'HistoryManager', 'Command', 'EntitySnapshotCommand',
     'AddBodyPartCommand', 'RemoveBodyPartCommand', 'ModifyBodyPartCommand',
     'MoveBodyPartCommand', 'AddHitboxCommand', 'RemoveHitboxCommand',
-    'ModifyHitboxCommand', 'MoveHitboxCommand'
+    'ModifyHitboxCommand', 'MoveHitboxCommand', 'FieldDeltaCommand'
 ]
+
+
+def __getattr__(name):
+    # The signal hub pulls in Qt; only import it when first asked for, so the
+    # data and undo/redo code can be used (and tested) without loading Qt.
+    if name in ('SignalHub', 'get_signal_hub'):
+        from . import signal_hub
+        return getattr(signal_hub, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@ Implements the Command Pattern for undoable operations in the entity editor.
 """
 
 import copy
-from typing import Any, Dict
+from typing import Any, Dict, Tuple, Union
 from src.data import BodyPart, Hitbox, Vec2
 
 
@@ -261,3 +261,48 @@ class MoveHitboxCommand(Command):
     
     def get_description(self) -> str:
         return f"Move hitbox {self.hitbox.name}"
+
+
+class FieldDeltaCommand(Command):
+    """
+    Command that changes a single field reached by walking a path from the entity.
+
+    The path mixes attribute names and list indices, e.g.
+    ``("body_parts", 0, "position", "x")``.
+    """
+    
+    def __init__(self, target_path: Tuple[Union[str, int], ...], old: Any, new: Any):
+        self.target_path = tuple(target_path)
+        self.old = old
+        self.new = new
+    
+    def execute(self, entity, signal_hub=None):
+        """Set the field to its new value."""
+        self._apply(entity, self.new)
+        if signal_hub:
+            signal_hub.notify_entity_modified()
+    
+    def undo(self, entity, signal_hub=None):
+        """Set the field back to its old value."""
+        self._apply(entity, self.old)
+        if signal_hub:
+            signal_hub.notify_entity_modified()
+    
+    def _apply(self, entity, value: Any):
+        """Walk to the parent of the target field and assign value."""
+        target = entity
+        for key in self.target_path[:-1]:
+            target = target[key] if isinstance(key, int) else getattr(target, key)
+        
+        # Containers are copied so the live entity never aliases our stored value
+        if isinstance(value, (list, dict)):
+            value = copy.deepcopy(value)
+        
+        key = self.target_path[-1]
+        if isinstance(key, int):
+            target[key] = value
+        else:
+            setattr(target, key, value)
+    
+    def get_description(self) -> str:
+        return "Set " + ".".join(str(key) for key in self.target_path)
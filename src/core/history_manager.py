@@ -30,8 +30,9 @@ class HistoryManager:
         self._pending_snapshot = None  # For begin_change/end_change pattern
     
     def set_entity(self, entity: Optional[Entity]):
-        """Set the entity and clear history."""
+        """Set the entity and clear history, so one manager can be reused across entities."""
         self._entity = entity
+        self._pending_snapshot = None  # Taken from the previous entity
         self.clear()
     
     def execute(self, command: Command):
@@ -64,6 +65,42 @@ class HistoryManager:
             self._signal_hub.notify_entity_modified()
             self._update_undo_redo_state()
     
+    def execute_many(self, commands: List[Command]):
+        """
+        Execute several commands and add them to history as one batch.
+        
+        Each command stays a separate undo step, but redo history is
+        discarded and the max size is enforced once, and the history's own
+        change notification (entity_modified plus the undo/redo state) is
+        sent once for the whole batch. Each command still emits its own
+        signals (e.g. bodypart_added) as it executes.
+        
+        Args:
+            commands: The commands to execute, in order
+        """
+        commands = list(commands)
+        if not self._entity or not commands:
+            return
+        
+        # Discard all redo history (everything after current index)
+        self._commands = self._commands[:self._current_index + 1]
+        
+        # Execute the commands
+        for command in commands:
+            command.execute(self._entity, self._signal_hub)
+        
+        # Add to history, then enforce max size by removing oldest commands
+        self._commands.extend(commands)
+        overflow = len(self._commands) - self._max_size
+        if overflow > 0:
+            del self._commands[:overflow]
+        self._current_index = len(self._commands) - 1
+        
+        # Notify changes
+        if self._signal_hub:
+            self._signal_hub.notify_entity_modified()
+            self._update_undo_redo_state()
+    
     def undo(self) -> bool:
         """
         Undo the last command.
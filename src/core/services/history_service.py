@@ -47,3 +47,7 @@ class HistoryService(QObject):
     def execute(self, command):
         """Execute a command directly (Legacy support)."""
         self._manager.execute(command)
+        
+    def execute_many(self, commands):
+        """Execute several commands as one undo batch; see HistoryManager.execute_many."""
+        self._manager.execute_many(commands)
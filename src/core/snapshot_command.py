@@ -2,10 +2,61 @@
 Snapshot-based undo command for capturing entity states.
 
 Much simpler than per-property commands - just stores complete entity state.
+When the entity's structure is unchanged, the finalized command keeps only
+the fields that changed instead of two full copies.
 """
 
 import copy
+from dataclasses import fields, is_dataclass, replace
+from typing import Any, List, Optional, Tuple
 from src.data import Entity
+from src.core.command import FieldDeltaCommand
+
+
+def _diff(before: Any, after: Any, path: Tuple, out: List[FieldDeltaCommand]) -> bool:
+    """
+    Append a FieldDeltaCommand for every leaf that differs between before and after.
+    
+    Returns False if the two trees differ structurally (added, removed or
+    reordered items), in which case the deltas collected so far are unusable.
+    """
+    if is_dataclass(before) or is_dataclass(after):
+        if type(before) is not type(after):
+            return False
+        for f in fields(before):
+            if not _diff(getattr(before, f.name), getattr(after, f.name), path + (f.name,), out):
+                return False
+        return True
+    
+    if isinstance(before, list) and isinstance(after, list) and any(map(is_dataclass, before + after)):
+        if len(before) != len(after):
+            return False
+        # Items are edited in place, so reordering must keep object identity
+        if [getattr(i, 'id', None) for i in before] != [getattr(i, 'id', None) for i in after]:
+            return False
+        for index, (b, a) in enumerate(zip(before, after)):
+            if not _diff(b, a, path + (index,), out):
+                return False
+        return True
+    
+    if before != after:
+        out.append(FieldDeltaCommand(path, copy.deepcopy(before), copy.deepcopy(after)))
+    return True
+
+
+def _share_unchanged(previous: List[Any], live: List[Any], key) -> List[Any]:
+    """
+    Copy live items, reusing the matching item from previous where it is unchanged.
+    
+    Snapshots are never mutated once taken, so two snapshots can safely
+    share the copies of items the change did not touch.
+    """
+    previous_by_key = {key(i, item): item for i, item in enumerate(previous)}
+    result = []
+    for i, item in enumerate(live):
+        prev = previous_by_key.get(key(i, item))
+        result.append(prev if prev is not None and prev == item else copy.deepcopy(item))
+    return result
 
 
 class EntitySnapshotCommand:
@@ -22,22 +73,57 @@ class EntitySnapshotCommand:
         # Deep copy the CURRENT state as "before" state
         self.before_state = copy.deepcopy(entity)
         self.after_state = None  # Will be set when finalizing
+        self.deltas: Optional[List[FieldDeltaCommand]] = None  # Set by finalize when possible
         self.description = description
         
-    def finalize(self, entity: Entity):
-        """Capture the 'after' state. Call this after the change is made."""
-        self.after_state = copy.deepcopy(entity)
+    def finalize(self, entity: Entity) -> Optional[List[FieldDeltaCommand]]:
+        """
+        Capture the 'after' state. Call this after the change is made.
+        
+        Returns the field deltas if the change could be stored that way, in
+        which case both full snapshots are released; otherwise falls back to
+        storing a full 'after' snapshot and returns None.
+        """
+        deltas: List[FieldDeltaCommand] = []
+        if _diff(self.before_state, entity, (), deltas):
+            self.deltas = deltas
+            self.before_state = None
+        else:
+            self.after_state = self._snapshot_sharing(self.before_state, entity)
+        return self.deltas
+    
+    @staticmethod
+    def _snapshot_sharing(before: Entity, entity: Entity) -> Entity:
+        """Snapshot entity, sharing body parts and hitboxes unchanged since before."""
+        return replace(
+            entity,
+            pivot=copy.deepcopy(entity.pivot),
+            # Body parts are matched by id so reordering still shares them
+            body_parts=_share_unchanged(before.body_parts, entity.body_parts, lambda i, bp: bp.id),
+            entity_hitboxes=_share_unchanged(before.entity_hitboxes, entity.entity_hitboxes, lambda i, hb: i),
+            tags=copy.deepcopy(entity.tags),
+            metadata=copy.deepcopy(entity.metadata),
+        )
     
     def execute(self, entity: Entity, signal_hub=None):
         """Apply the 'after' state."""
-        if self.after_state:
+        if self.deltas is not None:
+            for delta in self.deltas:
+                delta.execute(entity)
+        elif self.after_state:
             self._apply_state(entity, self.after_state)
-            if signal_hub:
-                signal_hub.notify_entity_modified()
+        else:
+            return
+        if signal_hub:
+            signal_hub.notify_entity_modified()
     
     def undo(self, entity: Entity, signal_hub=None):
         """Restore the 'before' state."""
-        self._apply_state(entity, self.before_state)
+        if self.deltas is not None:
+            for delta in reversed(self.deltas):
+                delta.undo(entity)
+        else:
+            self._apply_state(entity, self.before_state)
         if signal_hub:
             signal_hub.notify_entity_modified()
     
@@ -126,6 +126,16 @@ class Selection(QObject):
                 self._primary_id = bodypart.id
             self._notify()
 
+    def add_bodyparts_to_selection(self, bodyparts: List[BodyPart]):
+        """Add several body parts to the selection with a single change notification."""
+        new_ids = [bp.id for bp in bodyparts if bp.id not in self._selected_ids]
+        if not new_ids:
+            return
+        self._selected_ids.update(new_ids)
+        if not self._primary_id:
+            self._primary_id = new_ids[0]
+        self._notify()
+
     def toggle_selection(self, bodypart: BodyPart):
         """Toggle selection. Alias for select_bodypart(bp, True)."""
         self.select_bodypart(bodypart, additive=True)
@@ -12,10 +12,14 @@ This module defines the fundamental data structures used throughout the editor:
 from dataclasses import dataclass, field, asdict
 from typing import List, Optional, Dict, Any
 from enum import Enum
+import sys
 import uuid
 
+# __slots__ drop the per-instance __dict__; dataclass only generates them on 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Vec2:
     """2D vector for positions and sizes."""
     x: float = 0.0
@@ -48,7 +52,7 @@ class Vec2:
         yield self.y
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UVRect:
     """
     UV rectangle with normalized coordinates (0.0 to 1.0).
@@ -91,7 +95,7 @@ class UVRect:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Hitbox:
     """
     Hitbox with integer pixel precision.
@@ -162,9 +166,17 @@ class Hitbox:
                 hitbox_type=data.get("hitbox_type", "collision"),
                 enabled=data.get("enabled", True)
             )
+    
+    def get_world_rect(self, offset: Vec2) -> tuple:
+        """
+        Get the hitbox rectangle in world space.
+        offset is the parent's position (body part position or entity pivot).
+        Returns (x, y, width, height).
+        """
+        return (offset.x + self.x, offset.y + self.y, self.width, self.height)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BodyPart:
     """
     Individual body part of an entity.
@@ -234,7 +246,7 @@ class BodyPart:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Entity:
     """
     Top-level entity definition.
@@ -278,6 +290,11 @@ class Entity:
             metadata=data.get("metadata", {})
         )
     
+    @property
+    def is_empty(self) -> bool:
+        """True if the entity has no body parts."""
+        return not self.body_parts
+    
     def get_body_part(self, name: str) -> Optional[BodyPart]:
         """Get body part by name."""
         for bp in self.body_parts:
@@ -291,6 +308,13 @@ class Entity:
     
     def remove_body_part(self, body_part: BodyPart) -> bool:
         """Remove a body part from the entity. Returns True if successful."""
+        # Match by identity first: dataclass __eq__ compares every field of
+        # every body part it passes on the way.
+        for i, bp in enumerate(self.body_parts):
+            if bp is body_part:
+                del self.body_parts[i]
+                return True
+        
         if body_part in self.body_parts:
             self.body_parts.remove(body_part)
             return True
@@ -5,9 +5,38 @@ Handles loading, caching, and managing textures for the editor.
 """
 
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Set, Tuple
 from PySide6.QtGui import QPixmap, QImage
-from PySide6.QtCore import QSize
+from PySide6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal, Slot
+
+from src.core import get_signal_hub
+
+
+class _TextureLoadTask(QRunnable):
+    """Decodes one image file on a worker thread (QImage is thread-safe, QPixmap is not)."""
+    
+    def __init__(self, filepath: str, loader: '_AsyncTextureLoader'):
+        super().__init__()
+        self._filepath = filepath
+        self._loader = loader
+    
+    def run(self):
+        self._loader.image_ready.emit(self._filepath, QImage(self._filepath))
+
+
+class _AsyncTextureLoader(QObject):
+    """Receives decoded images back on the GUI thread via a queued signal."""
+    
+    image_ready = Signal(str, QImage)
+    
+    def __init__(self, manager: 'TextureManager'):
+        super().__init__()
+        self._manager = manager
+        self.image_ready.connect(self._on_image_ready, Qt.QueuedConnection)
+    
+    @Slot(str, QImage)
+    def _on_image_ready(self, filepath: str, image: QImage):
+        self._manager._finish_prefetch(filepath, image)
 
 
 class TextureManager:
@@ -15,11 +44,23 @@ class TextureManager:
     Manages texture loading and caching.
     
     Textures are loaded once and cached for reuse across the application.
+    Sub-regions cut out of a texture (UV rects) are cached as well, so the
+    viewport does not copy pixels on every repaint.
+    Textures can also be prefetched in the background (see prefetch()).
     """
     
+    # Limits for cached sub-textures, by count and by total pixels (~64 MB
+    # at 4 bytes per pixel); oldest entries are evicted first
+    MAX_SUBTEXTURES = 256
+    MAX_SUBTEXTURE_PIXELS = 4096 * 4096
+    
     def __init__(self):
         self._texture_cache: Dict[str, QPixmap] = {}
         self._texture_sizes: Dict[str, Tuple[int, int]] = {}
+        self._subtexture_cache: Dict[Tuple[str, int, int, int, int, int, int], QPixmap] = {}
+        self._subtexture_pixels = 0  # Total pixels held by _subtexture_cache
+        self._loading: Set[str] = set()
+        self._async_loader: Optional[_AsyncTextureLoader] = None
     
     def load_texture(self, filepath: str) -> Optional[QPixmap]:
         """
@@ -52,6 +93,46 @@ class TextureManager:
         self._texture_sizes[filepath] = (pixmap.width(), pixmap.height())
         return pixmap
     
+    def prefetch(self, filepaths: Iterable[str]):
+        """
+        Start loading textures on a background thread.
+        
+        The QPixmap is created on the GUI thread once the image is decoded,
+        then texture_loaded is emitted on the signal hub. Paths that are
+        already cached, already loading or missing are skipped.
+        
+        Args:
+            filepaths: Paths of the texture files
+        """
+        for filepath in filepaths:
+            if filepath in self._texture_cache or filepath in self._loading:
+                continue
+            path = Path(filepath)
+            if not path.exists() or not path.is_file():
+                continue
+            
+            if self._async_loader is None:
+                self._async_loader = _AsyncTextureLoader(self)
+            self._loading.add(filepath)
+            QThreadPool.globalInstance().start(_TextureLoadTask(filepath, self._async_loader))
+    
+    def is_loading(self, filepath: str) -> bool:
+        """Check if a texture is still being loaded in the background."""
+        return filepath in self._loading
+    
+    def _finish_prefetch(self, filepath: str, image: QImage):
+        self._loading.discard(filepath)
+        if filepath in self._texture_cache:
+            return
+        if image.isNull():
+            print(f"Failed to load texture: {filepath}")
+            return
+        
+        pixmap = QPixmap.fromImage(image)
+        self._texture_cache[filepath] = pixmap
+        self._texture_sizes[filepath] = (pixmap.width(), pixmap.height())
+        get_signal_hub().notify_texture_loaded(filepath)
+    
     def get_texture(self, filepath: str) -> Optional[QPixmap]:
         """
         Get a cached texture or load if not cached.
@@ -83,10 +164,56 @@ class TextureManager:
             return self._texture_sizes[filepath]
         return None
     
+    def get_subtexture(self, filepath: str, x: int, y: int, w: int, h: int,
+                       out_w: Optional[int] = None, out_h: Optional[int] = None) -> Optional[QPixmap]:
+        """
+        Get a cached copy of a rectangular region of a texture.
+        
+        Args:
+            filepath: Path to the texture file
+            x, y, w, h: Region in pixel coordinates
+            out_w, out_h: Optional output size; the region is scaled to it
+                (nearest neighbour, for pixel art) once and cached that way
+            
+        Returns:
+            QPixmap of the region if the texture is available, None otherwise
+        """
+        out_w = w if out_w is None else out_w
+        out_h = h if out_h is None else out_h
+        key = (filepath, x, y, w, h, out_w, out_h)
+        sub_pixmap = self._subtexture_cache.get(key)
+        if sub_pixmap is not None:
+            return sub_pixmap
+        
+        pixmap = self.load_texture(filepath)
+        if not pixmap:
+            return None
+        
+        sub_pixmap = pixmap.copy(x, y, w, h)
+        if (out_w, out_h) != (w, h):
+            sub_pixmap = sub_pixmap.scaled(out_w, out_h, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        
+        # Evict the oldest entries (dicts keep insertion order) until the new one fits
+        pixels = sub_pixmap.width() * sub_pixmap.height()
+        while self._subtexture_cache and (len(self._subtexture_cache) >= self.MAX_SUBTEXTURES or
+                                          self._subtexture_pixels + pixels > self.MAX_SUBTEXTURE_PIXELS):
+            self._drop_subtexture(next(iter(self._subtexture_cache)))
+        
+        self._subtexture_cache[key] = sub_pixmap
+        self._subtexture_pixels += pixels
+        return sub_pixmap
+    
+    def _drop_subtexture(self, key):
+        """Remove one cached sub-texture, keeping the pixel total in step."""
+        sub_pixmap = self._subtexture_cache.pop(key)
+        self._subtexture_pixels -= sub_pixmap.width() * sub_pixmap.height()
+    
     def clear_cache(self):
         """Clear all cached textures."""
         self._texture_cache.clear()
         self._texture_sizes.clear()
+        self._subtexture_cache.clear()
+        self._subtexture_pixels = 0
     
     def remove_texture(self, filepath: str):
         """Remove a specific texture from cache."""
@@ -94,6 +221,8 @@ class TextureManager:
             del self._texture_cache[filepath]
         if filepath in self._texture_sizes:
             del self._texture_sizes[filepath]
+        for key in [k for k in self._subtexture_cache if k[0] == filepath]:
+            self._drop_subtexture(key)
     
     def is_cached(self, filepath: str) -> bool:
         """Check if a texture is currently cached."""
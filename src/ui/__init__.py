@@ -1,4 +1,12 @@
 """UI module for Entity Editor."""
-from .main_window import MainWindow
 
 __all__ = ['MainWindow']
+
+
+def __getattr__(name):
+    # Imported on demand so submodules (e.g. ui.viewport.spatial_index) can be
+    # used without building the whole widget tree.
+    if name == 'MainWindow':
+        from .main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,42 @@
+
+from typing import Any, Dict, List, Tuple
+
+class SpatialIndex:
+    """
+    Uniform grid over world space for fast point hit-testing.
+
+    Each item is stored in every cell its bounding rect overlaps, so a point
+    query only has to look at the few items sharing that point's cell.
+    Items keep their insertion order within a cell, which lets callers
+    encode priority (e.g. top-most first) simply by inserting in that order.
+    """
+
+    CELL_SIZE = 128
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Any]] = {}
+
+    def clear(self):
+        """Remove all items."""
+        self._cells.clear()
+
+    def insert(self, item: Any, x: float, y: float, w: float, h: float):
+        """Add an item covering the world rect (x, y, w, h), edges inclusive."""
+        cs = self._cell_size
+        x0, x1 = int(x // cs), int((x + w) // cs)
+        y0, y1 = int(y // cs), int((y + h) // cs)
+
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    cell.append(item)
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        """Items whose cell contains the point, in insertion order (may not contain it exactly)."""
+        cs = self._cell_size
+        return self._cells.get((int(x // cs), int(y // cs)), [])
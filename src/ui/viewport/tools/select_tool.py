@@ -1,12 +1,29 @@
 
-from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QMouseEvent, QKeyEvent, QPainter, QPen, QColor
+from PySide6.QtCore import Qt, QRectF, QTimer
+from PySide6.QtGui import QMouseEvent, QKeyEvent, QPainter, QPen, QBrush, QColor
 
 from src.core.state.editor_state import EditorState
 from src.core import get_signal_hub
 from src.ui.viewport.tools.abstract_tool import AbstractTool
+from src.ui.viewport.spatial_index import SpatialIndex
 from src.data import Vec2
 
+def _edge_for_mask(mask: int):
+    # Bits: 1 = left, 2 = right, 4 = top, 8 = bottom; corners win over edges
+    l, r, t, b = mask & 1, mask & 2, mask & 4, mask & 8
+    if l and t: return 'tl'
+    if r and t: return 'tr'
+    if l and b: return 'bl'
+    if r and b: return 'br'
+    if l: return 'left'
+    if r: return 'right'
+    if t: return 'top'
+    if b: return 'bottom'
+    return None
+
+# Edge/corner name for every combination of near-edge flags
+_EDGE_TABLE = tuple(_edge_for_mask(mask) for mask in range(16))
+
 class SelectTool(AbstractTool):
     """
     Tool for selecting and moving entities and hitboxes.
@@ -23,7 +40,8 @@ class SelectTool(AbstractTool):
         self._box_current_pos = Vec2(0, 0)
         
         self._drag_start_pos = Vec2(0, 0)
-        self._drag_start_positions = {} # Map(id -> Vec2)
+        self._drag_items = [] # List of (BodyPart, start_x, start_y)
+        self._any_drag_motion = False # Set once the mouse moves during a drag
         
         # Hitbox specific state
         self._dragging_hitbox = None # Hitbox reference
@@ -32,13 +50,47 @@ class SelectTool(AbstractTool):
         self._drag_start_hitbox_pos = Vec2(0, 0)
         self._drag_start_hitbox_size = Vec2(0, 0)
         
+        # Box selection pen/brush, built once
+        self._box_pen = QPen(QColor(100, 200, 255), 1)
+        self._box_brush = QBrush(QColor(100, 200, 255, 50))
+        
         # Grid settings (could be moved to EditorState eventually)
         self._grid_size = 1
         
+        # Hover hit-testing is throttled; the cursor is only set when it changes
+        self._last_hover_pos = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(32)
+        self._hover_timer.timeout.connect(self._do_hover_update)
+        
+        # Drag notifications are coalesced: moves only update the data and
+        # listeners are notified once per event-loop pass (and on release)
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(0)
+        self._notify_timer.timeout.connect(self._flush_drag_notifications)
+        
+        # Spatial indexes for hit-testing, rebuilt lazily after scene changes
+        self._bp_index = SpatialIndex()
+        self._hitbox_index = SpatialIndex()
+        self._index_entity = None
+        self._index_dirty = True
+        
+        signal_hub = get_signal_hub()
+        for signal in (signal_hub.entity_loaded, signal_hub.entity_modified,
+                       signal_hub.bodypart_modified, signal_hub.bodypart_added,
+                       signal_hub.bodypart_removed, signal_hub.bodypart_reordered,
+                       signal_hub.hitbox_modified, signal_hub.hitbox_added,
+                       signal_hub.hitbox_removed):
+            signal.connect(self._invalidate_index)
+        
     def activate(self):
         self._reset_state()
         
     def deactivate(self):
+        self._hover_timer.stop()
+        self._flush_pending_drag_notifications()
         self._reset_state()
         
     def _reset_state(self):
@@ -47,7 +99,8 @@ class SelectTool(AbstractTool):
         self._dragging_hitbox = None
         self._dragging_hitbox_parent = None
         self._resize_edge = None
-        self._drag_start_positions.clear()
+        self._drag_items = []
+        self._any_drag_motion = False
 
     def mouse_press(self, event: QMouseEvent, world_pos: Vec2):
         if event.button() == Qt.LeftButton:
@@ -77,37 +130,63 @@ class SelectTool(AbstractTool):
     def mouse_move(self, event: QMouseEvent, world_pos: Vec2):
         # 1. Handle Dragging Hitbox
         if self._dragging_hitbox:
+            self._any_drag_motion = True
             self._handle_hitbox_drag(world_pos)
             return
 
-        # Cursor Updates (Hover)
-        self._update_cursor_shape(world_pos)
+        # Cursor Updates (Hover, throttled)
+        self._last_hover_pos = world_pos
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
         
-        # 2. Handle Box Selection
+        # 2. Handle Box Selection (repaint only the area the box covered or covers)
         if self._is_box_selecting:
+            old_rect = self._get_box_rect()
             self._box_current_pos = world_pos
+            self._view.update_world_rect(old_rect.united(self._get_box_rect()).adjusted(-1, -1, 1, 1))
             return
             
         # 3. Handle Dragging BodyParts
-        if self._dragging and self._state.selection.selected_body_parts:
+        if self._dragging and self._drag_items:
+            self._any_drag_motion = True
             self._handle_bodypart_drag(world_pos)
             
     def mouse_release(self, event: QMouseEvent, world_pos: Vec2):
         if event.button() == Qt.LeftButton:
-            # Commit Hitbox Change
+            # Listeners must see the final state before the change is committed
+            self._flush_pending_drag_notifications()
+            
+            # Commit Hitbox Change (only if the mouse moved and something changed)
             if self._dragging_hitbox:
                 if self._state.history:
-                    self._state.history.end_change()
+                    hitbox = self._dragging_hitbox
+                    changed = self._any_drag_motion and (
+                        hitbox.x != self._drag_start_hitbox_pos.x or
+                        hitbox.y != self._drag_start_hitbox_pos.y or
+                        hitbox.width != self._drag_start_hitbox_size.x or
+                        hitbox.height != self._drag_start_hitbox_size.y)
+                    if changed:
+                        self._state.history.end_change()
+                    else:
+                        self._state.history.cancel_change()
                 self._dragging_hitbox = None
                 self._resize_edge = None
                 
             if self._dragging:
                 if self._state.history:
-                    # Check if actually moved to avoid empty undo entries?
-                    # The service might handle this, or we check here.
-                    self._state.history.end_change()
+                    # Only record an undo entry if something actually moved;
+                    # a click without motion skips the scan entirely
+                    moved = self._any_drag_motion and any(
+                        bp.position.x != start_x or bp.position.y != start_y
+                        for bp, start_x, start_y in self._drag_items)
+                    if moved:
+                        self._state.history.end_change()
+                    else:
+                        self._state.history.cancel_change()
                 self._dragging = False
-                self._drag_start_positions.clear()
+                self._drag_items = []
+            
+            self._any_drag_motion = False
             
             # Commit Box Selection
             if self._is_box_selecting:
@@ -118,27 +197,24 @@ class SelectTool(AbstractTool):
 
     def render(self, painter: QPainter):
         if self._is_box_selecting:
-            # Create rect from start/current
-            x = min(self._box_start_pos.x, self._box_current_pos.x)
-            y = min(self._box_start_pos.y, self._box_current_pos.y)
-            w = abs(self._box_current_pos.x - self._box_start_pos.x)
-            h = abs(self._box_current_pos.y - self._box_start_pos.y)
-            
-            rect = QRectF(x, y, w, h)
+            rect = self._get_box_rect()
             
             # Draw semi-transparent blue box
-            painter.setPen(QPen(QColor(100, 200, 255), 1))
-            painter.setBrush(QColor(100, 200, 255, 50))
+            painter.setPen(self._box_pen)
+            painter.setBrush(self._box_brush)
             painter.drawRect(rect)
     
-    def _handle_box_selection(self, modifiers):
-        # Calculate Box Rect
+    def _get_box_rect(self) -> QRectF:
+        # Create rect from start/current
         x = min(self._box_start_pos.x, self._box_current_pos.x)
         y = min(self._box_start_pos.y, self._box_current_pos.y)
         w = abs(self._box_current_pos.x - self._box_start_pos.x)
         h = abs(self._box_current_pos.y - self._box_start_pos.y)
-        
-        box_rect = QRectF(x, y, w, h)
+        return QRectF(x, y, w, h)
+    
+    def _handle_box_selection(self, modifiers):
+        # Calculate Box Rect
+        box_rect = self._get_box_rect()
         
         # Find intersecting body parts
         entity = self._state.current_entity
@@ -161,10 +237,13 @@ class SelectTool(AbstractTool):
         # Implying additive or replacement? 
         # Usually Box Select replaces selection unless Modifier is held.
         # Logic in mouse_press already cleared selection if no modifier.
-        # So here we just ADD whatever is in the box.
+        # So here we just ADD whatever is in the box, notifying once for the lot.
         
-        for bp in affected_bps:
-            self._state.selection.add_to_selection(bp)
+        self._state.selection.add_bodyparts_to_selection(affected_bps)
+
+    def _do_hover_update(self):
+        if self._last_hover_pos is not None:
+            self._update_cursor_shape(self._last_hover_pos)
 
     def _update_cursor_shape(self, world_pos: Vec2):
         if not self._state.hitbox_edit_mode:
@@ -176,21 +255,26 @@ class SelectTool(AbstractTool):
             edge = self._get_hitbox_edge(hitbox, parent_bp, world_pos)
             if edge:
                 if edge in ['left', 'right']:
-                    self._view.setCursor(Qt.SizeHorCursor)
+                    self._set_cursor(Qt.SizeHorCursor)
                 elif edge in ['top', 'bottom']:
-                    self._view.setCursor(Qt.SizeVerCursor)
+                    self._set_cursor(Qt.SizeVerCursor)
                 elif edge in ['tl', 'br']:
-                    self._view.setCursor(Qt.SizeFDiagCursor)
+                    self._set_cursor(Qt.SizeFDiagCursor)
                 elif edge in ['tr', 'bl']:
-                    self._view.setCursor(Qt.SizeBDiagCursor)
+                    self._set_cursor(Qt.SizeBDiagCursor)
                 else:
-                    self._view.setCursor(Qt.SizeAllCursor) # Move
+                    self._set_cursor(Qt.SizeAllCursor) # Move
                 return
         
         self._reset_cursor()
 
+    def _set_cursor(self, shape):
+        # Compare against the view's real cursor: the view sets it too (e.g. while panning)
+        if self._view.cursor().shape() != shape:
+            self._view.setCursor(shape)
+
     def _reset_cursor(self):
-        self._view.setCursor(Qt.ArrowCursor)
+        self._set_cursor(Qt.ArrowCursor)
 
     # --- Logic Helpers ---
 
@@ -208,6 +292,7 @@ class SelectTool(AbstractTool):
         self._dragging_hitbox = hitbox
         self._dragging_hitbox_parent = parent_bp
         self._resize_edge = edge
+        self._any_drag_motion = False
         self._drag_start_pos = world_pos
         self._drag_start_hitbox_pos = Vec2(hitbox.x, hitbox.y)
         self._drag_start_hitbox_size = Vec2(hitbox.width, hitbox.height)
@@ -227,10 +312,10 @@ class SelectTool(AbstractTool):
         # Start Dragging (if we have a selection)
         if self._state.selection.has_selection:
             self._dragging = True
+            self._any_drag_motion = False
             self._drag_start_pos = world_pos
-            self._drag_start_positions = {}
-            for bp in self._state.selection.selected_body_parts:
-                self._drag_start_positions[id(bp)] = Vec2(bp.position.x, bp.position.y)
+            self._drag_items = [(bp, bp.position.x, bp.position.y)
+                                for bp in self._state.selection.selected_body_parts]
             
             if self._state.history:
                 self._state.history.begin_change("Move Body Part")
@@ -272,112 +357,124 @@ class SelectTool(AbstractTool):
             self._dragging_hitbox.x = self._snap(new_x)
             self._dragging_hitbox.y = self._snap(new_y)
             
-        # Signal update (Legacy compatibility or new signal needed?)
-        # For now, we assume direct modification is watched or we trigger update via State?
-        # Ideally EditorState should expose a method to notify modification if not automatic.
-        # But since we modified data objects directly, we might need to emit a signal.
-        # self._state.notify_entity_modified() # Hypothetical method
-        get_signal_hub().notify_hitbox_modified(self._dragging_hitbox) 
+        # Signal update (coalesced, see _flush_drag_notifications)
+        if not self._notify_timer.isActive():
+            self._notify_timer.start()
 
     def _handle_bodypart_drag(self, world_pos: Vec2):
-        delta = world_pos - self._drag_start_pos
+        dx = world_pos.x - self._drag_start_pos.x
+        dy = world_pos.y - self._drag_start_pos.y
+        snap = self._snap
         
-        for bp in self._state.selection.selected_body_parts:
-            if id(bp) in self._drag_start_positions:
-                start_pos = self._drag_start_positions[id(bp)]
-                new_x = start_pos.x + delta.x
-                new_y = start_pos.y + delta.y
-                
-                bp.position.x = self._snap(new_x)
-                bp.position.y = self._snap(new_y)
-                
-                get_signal_hub().notify_bodypart_modified(bp)
+        for bp, start_x, start_y in self._drag_items:
+            bp.position.x = snap(start_x + dx)
+            bp.position.y = snap(start_y + dy)
 
-        # self._state.notify_entity_modified()
+        # Signal update (coalesced, see _flush_drag_notifications)
+        if not self._notify_timer.isActive():
+            self._notify_timer.start()
+
+    def _flush_drag_notifications(self):
+        """Notify listeners about the items changed by the current drag."""
+        signal_hub = get_signal_hub()
+        if self._dragging_hitbox:
+            signal_hub.notify_hitbox_modified(self._dragging_hitbox)
+        for bp, _, _ in self._drag_items:
+            signal_hub.notify_bodypart_modified(bp)
+
+    def _flush_pending_drag_notifications(self):
+        if self._notify_timer.isActive():
+            self._notify_timer.stop()
+            self._flush_drag_notifications()
 
     # --- Query/Math Helpers ---
     
     def _snap(self, value):
         return int(round(value)) # Pixel perfect integer snapping
 
-    def _get_bodypart_at(self, world_pos: Vec2):
-        # Iterate in reverse render order (top to bottom)
+    def _invalidate_index(self, *args):
+        self._index_dirty = True
+
+    def _ensure_index(self):
+        """Rebuild the hit-test indexes if the scene changed since the last query."""
         entity = self._state.current_entity
+        if not self._index_dirty and entity is self._index_entity:
+            return
+        
+        self._bp_index.clear()
+        self._hitbox_index.clear()
+        self._index_entity = entity
+        self._index_dirty = False
         if not entity:
+            return
+        
+        # Body parts go in top to bottom (reverse render order, shared with
+        # the renderer's sort cache), so the first hit within a cell is the top-most one
+        for bp in self._view.get_sorted_body_parts(descending=True):
+            self._bp_index.insert(bp, bp.position.x, bp.position.y, bp.size.x, bp.size.y)
+        
+        # Hitboxes are relative to their body part; entity hitboxes to the pivot.
+        # They follow the same top to bottom order, so the hitbox picked is
+        # the one of the top-most body part under the cursor.
+        for bp in self._view.get_sorted_body_parts(descending=True):
+            for hitbox in bp.hitboxes:
+                self._hitbox_index.insert((hitbox, bp), *hitbox.get_world_rect(bp.position))
+        if hasattr(entity, 'entity_hitboxes'):
+            offset = entity.pivot
+            for hitbox in entity.entity_hitboxes:
+                self._hitbox_index.insert((hitbox, None), *hitbox.get_world_rect(offset))
+
+    def _get_bodypart_at(self, world_pos: Vec2):
+        # Candidates come from the spatial index in top to bottom order
+        if not self._state.current_entity:
             return None
-            
-        # Prepare list in Render Order (Bottom to Top)
-        body_parts = list(entity.body_parts)
-        body_parts.sort(key=lambda bp: bp.z_order)
-        
-        # Handle Selection on Top
-        if self._state.selection_on_top and self._state.selection.has_selection:
-            unselected = [bp for bp in body_parts if not self._state.selection.is_selected(bp)]
-            selected = [bp for bp in body_parts if self._state.selection.is_selected(bp)]
-            body_parts = unselected + selected
-            
-        # Iterate in Reverse (Top to Bottom) to find first hit
-        for bp in reversed(body_parts):
+        self._ensure_index()
+        
+        # Handle Selection on Top: a selected hit wins over any unselected one
+        selection = self._state.selection
+        prefer_selected = self._state.selection_on_top and selection.has_selection
+        fallback = None
+        
+        x, y = world_pos.x, world_pos.y
+        for bp in self._bp_index.query_point(x, y):
             if not bp.visible:
                 continue
                 
-            # Simple interaction rect check
-            # For more precise checking, we might need rotated rect check
-            # but standard rect is usually fine for selection unless heavily rotated
-            
             # Using simple bounding box for now (ignoring rotation for selection hit test for simplicity, can enhance later)
-            if (bp.position.x <= world_pos.x <= bp.position.x + bp.size.x and 
-                bp.position.y <= world_pos.y <= bp.position.y + bp.size.y):
-                return bp
-        return None
+            if (bp.position.x <= x <= bp.position.x + bp.size.x and 
+                bp.position.y <= y <= bp.position.y + bp.size.y):
+                if not prefer_selected or selection.is_selected(bp):
+                    return bp
+                if fallback is None:
+                    fallback = bp
+        return fallback
 
     def _get_hitbox_at(self, world_pos: Vec2):
-        # Only if we are in a mode to check hitboxes? 
-        # For now, check all visible hitboxes.
+        # Checks all visible hitboxes; body part hitboxes before entity hitboxes
         entity = self._state.current_entity
         if not entity:
             return None, None
-
-        # Check BodyPart hitboxes
-        # If Selection is active, maybe only check hitboxes of selected bodypart?
-        # ViewportWidget logic: "Only draw hitboxes if this is the selected body part, or no body part is selected"
+        self._ensure_index()
         
-        target_bps = entity.body_parts
-        # If we have a selection, maybe restriction? 
-        # But usually you can click any hitbox.
+        # ViewportWidget logic: "Only draw hitboxes if this is the selected body part, or no body part is selected"
+        selection = self._state.selection
+        has_selection = selection.has_selection
         
-        for bp in reversed(target_bps):
-            if not bp.visible:
+        x, y = world_pos.x, world_pos.y
+        offset = entity.pivot
+        for hitbox, bp in self._hitbox_index.query_point(x, y):
+            if not hitbox.enabled:
                 continue
-            
-            # If logic requires only checking selected BP hitboxes:
-            if self._state.selection.has_selection and not self._state.selection.is_selected(bp): continue
-            
-            for hitbox in bp.hitboxes:
-                if not hitbox.enabled:
+            if bp is not None:
+                if not bp.visible:
                     continue
-                
-                # Hitboxes are relative to body part
-                abs_x = bp.position.x + hitbox.x
-                abs_y = bp.position.y + hitbox.y
-                
-                if (abs_x <= world_pos.x <= abs_x + hitbox.width and 
-                    abs_y <= world_pos.y <= abs_y + hitbox.height):
-                    return hitbox, bp
-                    
-        # Check Entity Hitboxes (if any)
-        if hasattr(entity, 'entity_hitboxes'):
-             for hitbox in entity.entity_hitboxes:
-                if not hitbox.enabled: continue
-                # Entity hitboxes relative to pivot? Or 0,0? 
-                # ViewportWidget used self._entity.pivot
-                offset = entity.pivot
-                abs_x = offset.x + hitbox.x
-                abs_y = offset.y + hitbox.y
-                
-                if (abs_x <= world_pos.x <= abs_x + hitbox.width and 
-                    abs_y <= world_pos.y <= abs_y + hitbox.height):
-                    return hitbox, None # No parent body part
+                if has_selection and not selection.is_selected(bp):
+                    continue
+            
+            # Hitboxes are relative to their body part, entity hitboxes to the pivot
+            abs_x, abs_y, w, h = hitbox.get_world_rect(bp.position if bp is not None else offset)
+            if abs_x <= x <= abs_x + w and abs_y <= y <= abs_y + h:
+                return hitbox, bp # bp is None for entity hitboxes
                     
         return None, None
 
@@ -385,26 +482,15 @@ class SelectTool(AbstractTool):
         # Determine strict corner/edge click
         # Need absolute coords
         offset = parent_bp.position if parent_bp else self._state.current_entity.pivot
-        x = offset.x + hitbox.x
-        y = offset.y + hitbox.y
-        w = hitbox.width
-        h = hitbox.height
+        x, y, w, h = hitbox.get_world_rect(offset)
         
         margin = 5 # Tolerance in world units? Or screen units?
         # Interaction should ideally be screen units, but we are in world_pos here.
         # Assuming 1:1 for simplicity or small margin.
         
-        l = abs(world_pos.x - x) < margin
-        r = abs(world_pos.x - (x + w)) < margin
-        t = abs(world_pos.y - y) < margin
-        b = abs(world_pos.y - (y + h)) < margin
-        
-        if l and t: return 'tl'
-        if r and t: return 'tr'
-        if l and b: return 'bl'
-        if r and b: return 'br'
-        if l: return 'left'
-        if r: return 'right'
-        if t: return 'top'
-        if b: return 'bottom'
-        return None
+        wx, wy = world_pos.x, world_pos.y
+        mask = ((abs(wx - x) < margin) |
+                ((abs(wx - (x + w)) < margin) << 1) |
+                ((abs(wy - y) < margin) << 2) |
+                ((abs(wy - (y + h)) < margin) << 3))
+        return _EDGE_TABLE[mask]
@@ -39,8 +39,9 @@ class ViewportController(QObject):
     def mouse_move(self, event: QMouseEvent):
         if self._active_tool:
             world_pos = self._view.screen_to_world(event.position())
+            # No blanket repaint here: hovering changes nothing on screen, and
+            # tools request the repaints they need (drags notify via signals)
             self._active_tool.mouse_move(event, world_pos)
-            self._view.update()
             
     def mouse_release(self, event: QMouseEvent):
         if self._active_tool:
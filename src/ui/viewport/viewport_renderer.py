@@ -1,17 +1,43 @@
 
-from PySide6.QtCore import Qt, QRectF, QPointF, QRect, QLineF
-from PySide6.QtGui import QPainter, QPen, QColor, QTransform, QPixmap
+from PySide6.QtCore import Qt, QRectF, QPointF, QRect, QLineF, QSize
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPixmap, QTransform
+import math
 
 from src.core.state.editor_state import EditorState
 from src.data import Vec2
 from src.rendering import get_texture_manager
 
+# Hitbox fill colors by type, with outline colors and fill brushes
+# precomputed once at import time
+_HITBOX_COLORS = {
+    "collision": QColor(255, 100, 100, 100),
+    "damage": QColor(255, 200, 100, 100),
+    "trigger": QColor(100, 255, 100, 100)
+}
+_HITBOX_DEFAULT = QColor(200, 200, 200, 100)
+_HITBOX_DARKER = {t: c.darker(150) for t, c in _HITBOX_COLORS.items()}
+_HITBOX_DEFAULT_DARKER = _HITBOX_DEFAULT.darker(150)
+_HITBOX_BRUSHES = {t: QBrush(c) for t, c in _HITBOX_COLORS.items()}
+_HITBOX_DEFAULT_BRUSH = QBrush(_HITBOX_DEFAULT)
+
 class ViewportRenderer:
     """
     Handles all rendering logic for the Viewport.
     Decoupled from the ViewportWidget interaction logic.
     """
     
+    # Screen-space margin (pixels) added around the view when culling,
+    # so outlines, resize handles and the pivot cross are never clipped.
+    CULL_MARGIN = 12
+    
+    # Minimum on-screen spacing (pixels) between grid lines; denser grids
+    # are coarsened by powers of two instead of drawing sub-pixel lines
+    MIN_GRID_SPACING = 4
+    
+    # Sprites up to this many pixels (at render size, i.e. 256 KB) are cached
+    # pre-scaled; larger ones are scaled by the painter to keep the cache small
+    MAX_PRESCALED_PIXELS = 256 * 256
+    
     def __init__(self, state: EditorState):
         self._state = state
         self._texture_manager = get_texture_manager()
@@ -21,7 +47,50 @@ class ViewportRenderer:
         self.show_grid = True
         self.show_pivot = True
         self.zoom = 1.0
+        self.viewport_size = (0, 0) # Screen size in pixels, set by the view
+        self._cull_rect = QRectF()
         
+        # Grid tile (regular lines only), reused across pans; see _draw_grid()
+        self._grid_pixmap = None
+        self._grid_tile_key = None
+        self._grid_last_transform = None
+        
+        # Body parts sorted by z-order (both directions), rebuilt only after invalidate()
+        self._sorted_parts = []
+        self._sorted_parts_desc = []
+        self._sorted_parts_entity = None
+        self._sorted_parts_dirty = True
+        
+        # Reusable pens/brushes (only the width changes with zoom)
+        self._placeholder_brush = QBrush(QColor(100, 100, 120, 128))
+        self._placeholder_pen = QPen(QColor(150, 150, 170))
+        self._selection_pen = QPen(QColor(100, 200, 255))
+        self._hitbox_selected_pen = QPen(QColor(255, 255, 100))
+        self._hitbox_pens = {t: QPen(c) for t, c in _HITBOX_DARKER.items()}
+        self._hitbox_default_pen = QPen(_HITBOX_DEFAULT_DARKER)
+        self._handle_brush = QBrush(QColor(255, 255, 100))
+        self._handle_pen = QPen(QColor(100, 100, 100))
+        self._pivot_pen = QPen(QColor(255, 255, 0))
+        self._grid_pen = QPen(QColor(60, 60, 60))
+        self._grid_origin_pen = QPen(QColor(80, 80, 80))
+        
+    def invalidate(self):
+        """Mark cached scene data (z-sorted body parts) as stale."""
+        self._sorted_parts_dirty = True
+
+    def get_sorted_body_parts(self, entity, descending: bool = False):
+        """
+        Body parts sorted by z-order, cached between changes.
+        Ascending is render order (bottom to top); descending is the exact
+        reverse (top to bottom), as used for hit-testing.
+        """
+        if self._sorted_parts_dirty or entity is not self._sorted_parts_entity:
+            self._sorted_parts = sorted(entity.body_parts, key=lambda bp: bp.z_order)
+            self._sorted_parts_desc = self._sorted_parts[::-1]
+            self._sorted_parts_entity = entity
+            self._sorted_parts_dirty = False
+        return self._sorted_parts_desc if descending else self._sorted_parts
+
     def render(self, painter: QPainter, view_rect: QRectF, visible_entity=None):
         """
         Main render method.
@@ -32,6 +101,10 @@ class ViewportRenderer:
         entity = visible_entity or self._state.current_entity
         if not entity:
             return
+        
+        # Anything outside this rect is skipped entirely
+        margin = self.CULL_MARGIN / self.zoom
+        self._cull_rect = view_rect.adjusted(-margin, -margin, margin, margin)
 
         # 0. Draw Grid
         if self._state.grid_visible:
@@ -58,9 +131,8 @@ class ViewportRenderer:
         #    parts_to_render.append(self._selected_bodypart)
         
         # We can implement z-sort or selection-on-top here.
-        body_parts = list(entity.body_parts)
-        # Sort by z-order (ascending)
-        body_parts.sort(key=lambda bp: bp.z_order)
+        # Sorted by z-order (ascending)
+        body_parts = self.get_sorted_body_parts(entity)
         
         # Selection on Top Logic
         if self._state.selection_on_top and self._state.selection.has_selection:
@@ -74,68 +146,119 @@ class ViewportRenderer:
             # Draw strictly by Z-order
             draw_list = body_parts
         
+        # Consecutive placeholders are batched into one drawRects() call;
+        # the batch is flushed whenever something must be drawn on top of it.
+        placeholder_rects = []
+        cull_rect = self._cull_rect
+        texture_manager = self._texture_manager
         for bp in draw_list:
             if not bp.visible:
                 continue
+            if not cull_rect.intersects(self._body_part_bounds(bp)):
+                continue
             
-            # Draw Texture
-            self._draw_body_part_texture(painter, bp)
+            # Draw Texture (never blocking on a texture still loading in the background)
+            if bp.texture_path and not texture_manager.is_loading(bp.texture_path):
+                self._flush_placeholders(painter, placeholder_rects)
+                self._draw_body_part_texture(painter, bp)
+            else:
+                # Placeholder for missing or still loading texture
+                placeholder_rects.append(QRectF(bp.position.x, bp.position.y, bp.size.x, bp.size.y))
             
             # Draw Selection Outline
             if self._state.selection.is_selected(bp):
+                self._flush_placeholders(painter, placeholder_rects)
                 self._draw_selection_highlight(painter, bp)
+        
+        self._flush_placeholders(painter, placeholder_rects)
+
+    def _flush_placeholders(self, painter: QPainter, rects: list):
+        """Draw and clear a batch of placeholder rects."""
+        if not rects:
+            return
+        self._placeholder_pen.setWidthF(1 / self.zoom)
+        painter.setBrush(self._placeholder_brush)
+        painter.setPen(self._placeholder_pen)
+        painter.drawRects(rects)
+        rects.clear()
+
+    def _body_part_bounds(self, bp) -> QRectF:
+        """World-space bounding rect of a body part, including rotation."""
+        width = bp.size.x * max(1, bp.pixel_scale)
+        height = bp.size.y * max(1, bp.pixel_scale)
+        if bp.rotation == 0:
+            return QRectF(bp.position.x, bp.position.y, width, height)
+        
+        # Rotated around its center: use the circumscribed square
+        radius = math.hypot(width, height) / 2
+        center_x = bp.position.x + width / 2
+        center_y = bp.position.y + height / 2
+        return QRectF(center_x - radius, center_y - radius, radius * 2, radius * 2)
 
     def _draw_body_part_texture(self, painter: QPainter, bp):
-        if bp.texture_path:
-            pixmap = self._texture_manager.get_texture(bp.texture_path)
-            if pixmap:
-                # Get UV rectangle in pixel coordinates
-                tex_size = self._texture_manager.get_texture_size(bp.texture_path)
-                if tex_size:
-                    px_x, px_y, px_w, px_h = bp.uv_rect.get_pixel_coords(tex_size[0], tex_size[1])
-                    sub_pixmap = pixmap.copy(px_x, px_y, px_w, px_h)
-                    
-                    # Apply flipping
-                    if bp.flip_x or bp.flip_y:
-                        flip_transform = QTransform()
-                        if bp.flip_x:
-                            flip_transform.scale(-1, 1)
-                        if bp.flip_y:
-                            flip_transform.scale(1, -1)
-                        sub_pixmap = sub_pixmap.transformed(flip_transform)
-                    
-                    # Draw with rotation
-                    render_width = bp.size.x * bp.pixel_scale
-                    render_height = bp.size.y * bp.pixel_scale
-                    
-                    painter.save()
-                    
-                    if bp.rotation != 0:
-                        center_x = bp.position.x + render_width / 2
-                        center_y = bp.position.y + render_height / 2
-                        painter.translate(center_x, center_y)
-                        painter.rotate(bp.rotation)
-                        painter.translate(-center_x, -center_y)
-                    
-                    target_rect = QRectF(bp.position.x, bp.position.y, render_width, render_height)
-                    painter.drawPixmap(target_rect, sub_pixmap, QRectF(sub_pixmap.rect()))
-                    
-                    painter.restore()
+        # Get UV rectangle in pixel coordinates
+        tex_size = self._texture_manager.get_texture_size(bp.texture_path)
+        if tex_size:
+            px_x, px_y, px_w, px_h = bp.uv_rect.get_pixel_coords(tex_size[0], tex_size[1])
+            render_width = bp.size.x * bp.pixel_scale
+            render_height = bp.size.y * bp.pixel_scale
+            
+            # Whole-pixel render sizes are served pre-scaled from the cache and
+            # blitted at a point, so no per-paint resampling is needed
+            prescaled = (render_width == int(render_width) and render_height == int(render_height) and
+                         render_width * render_height <= self.MAX_PRESCALED_PIXELS)
+            if prescaled:
+                sub_pixmap = self._texture_manager.get_subtexture(bp.texture_path, px_x, px_y, px_w, px_h,
+                                                                  int(render_width), int(render_height))
+            else:
+                sub_pixmap = self._texture_manager.get_subtexture(bp.texture_path, px_x, px_y, px_w, px_h)
+            
+            if sub_pixmap:
+                target_rect = QRectF(bp.position.x, bp.position.y, render_width, render_height)
+                
+                # Rotation and flipping are applied by the painter around the
+                # sprite center, so the cached pixmap is never transformed
+                scale_x = -1 if bp.flip_x else 1
+                scale_y = -1 if bp.flip_y else 1
+                if bp.rotation == 0 and scale_x == 1 and scale_y == 1:
+                    self._blit_sprite(painter, target_rect, sub_pixmap, prescaled)
+                    return
+                
+                painter.save()
+                
+                center_x = bp.position.x + render_width / 2
+                center_y = bp.position.y + render_height / 2
+                painter.translate(center_x, center_y)
+                if bp.rotation != 0:
+                    painter.rotate(bp.rotation)
+                if scale_x != 1 or scale_y != 1:
+                    painter.scale(scale_x, scale_y)
+                painter.translate(-center_x, -center_y)
+                
+                self._blit_sprite(painter, target_rect, sub_pixmap, prescaled)
+                
+                painter.restore()
+
+    def _blit_sprite(self, painter: QPainter, target_rect: QRectF, pixmap: QPixmap, prescaled: bool):
+        if prescaled:
+            painter.drawPixmap(target_rect.topLeft(), pixmap)
         else:
-            # Placeholder for missing texture
-            painter.setBrush(QColor(100, 100, 120, 128))
-            painter.setPen(QPen(QColor(150, 150, 170), 1 / self.zoom))
-            painter.drawRect(QRectF(bp.position.x, bp.position.y, bp.size.x, bp.size.y))
+            painter.drawPixmap(target_rect, pixmap, QRectF(pixmap.rect()))
 
     def _draw_selection_highlight(self, painter: QPainter, bp):
-        pen = QPen(QColor(100, 200, 255), 2 / self.zoom)
-        painter.setPen(pen)
+        self._selection_pen.setWidthF(2 / self.zoom)
+        painter.setPen(self._selection_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(QRectF(bp.position.x, bp.position.y, bp.size.x, bp.size.y))
 
     def _draw_hitboxes(self, painter: QPainter, entity):
-        # Draw BodyPart Hitboxes
-        for bp in entity.body_parts:
+        # Consecutive hitboxes of the same type are batched into one drawRects()
+        # call, keeping list order for overlaps; the selected one is drawn last, on top.
+        runs = []
+        selected_rects = []
+        
+        # Collect BodyPart Hitboxes (in z-order, matching hitbox picking)
+        for bp in self.get_sorted_body_parts(entity):
             if not bp.visible: continue
             
             # Logic from ViewportWidget: "Only draw hitboxes if this is the selected body part, or no body part is selected"
@@ -145,48 +268,53 @@ class ViewportRenderer:
             
             if not has_selection or is_selected:
                 for hitbox in bp.hitboxes:
-                    self._draw_single_hitbox(painter, hitbox, bp.position)
+                    self._collect_hitbox(hitbox, bp.position, runs, selected_rects)
                     
-        # Draw Entity Hitboxes
+        # Collect Entity Hitboxes
         if hasattr(entity, 'entity_hitboxes'):
             for hitbox in entity.entity_hitboxes:
-                self._draw_single_hitbox(painter, hitbox, entity.pivot)
+                self._collect_hitbox(hitbox, entity.pivot, runs, selected_rects)
+        
+        pen_width = 1 / self.zoom
+        for hitbox_type, rects in runs:
+            pen = self._hitbox_pens.get(hitbox_type, self._hitbox_default_pen)
+            pen.setWidthF(pen_width)
+            painter.setBrush(_HITBOX_BRUSHES.get(hitbox_type, _HITBOX_DEFAULT_BRUSH))
+            painter.setPen(pen)
+            painter.drawRects(rects)
+        
+        for hitbox_type, rect in selected_rects:
+            self._hitbox_selected_pen.setWidthF(2 / self.zoom)
+            painter.setBrush(_HITBOX_BRUSHES.get(hitbox_type, _HITBOX_DEFAULT_BRUSH))
+            painter.setPen(self._hitbox_selected_pen)
+            painter.drawRect(rect)
+            
+            # Draw handles if selected?
+            # Maybe let tool handle this? Or renderer draws if selected.
+            self._draw_resize_handles(painter, rect)
 
-    def _draw_single_hitbox(self, painter: QPainter, hitbox, offset: Vec2):
+    def _collect_hitbox(self, hitbox, offset: Vec2, runs: list, selected_rects: list):
         if not hitbox.enabled:
             return
-            
-        colors = {
-            "collision": QColor(255, 100, 100, 100),
-            "damage": QColor(255, 200, 100, 100),
-            "trigger": QColor(100, 255, 100, 100)
-        }
-        color = colors.get(hitbox.hitbox_type, QColor(200, 200, 200, 100))
-        
-        painter.setBrush(color)
         
-        is_selected = (hitbox == self._state.selection.selected_hitbox)
+        x, y, w, h = hitbox.get_world_rect(offset)
+        x, y = int(x), int(y)
+        if not self._cull_rect.intersects(QRectF(x, y, w, h)):
+            return
         
-        if is_selected:
-            painter.setPen(QPen(QColor(255, 255, 100), 2 / self.zoom))
+        rect = QRect(x, y, w, h)
+        if hitbox == self._state.selection.selected_hitbox:
+            selected_rects.append((hitbox.hitbox_type, rect))
+        elif runs and runs[-1][0] == hitbox.hitbox_type:
+            runs[-1][1].append(rect)
         else:
-            painter.setPen(QPen(color.darker(150), 1 / self.zoom))
-        
-        x = int(offset.x + hitbox.x)
-        y = int(offset.y + hitbox.y)
-        
-        rect = QRect(x, y, hitbox.width, hitbox.height)
-        painter.drawRect(rect)
-        
-        # Draw handles if selected?
-        # Maybe let tool handle this? Or renderer draws if selected.
-        if is_selected:
-            self._draw_resize_handles(painter, rect)
+            runs.append((hitbox.hitbox_type, [rect]))
 
     def _draw_resize_handles(self, painter: QPainter, rect: QRect):
         handle_size = 6 / self.zoom
-        painter.setBrush(QColor(255, 255, 100))
-        painter.setPen(QPen(QColor(100, 100, 100), 1 / self.zoom))
+        self._handle_pen.setWidthF(1 / self.zoom)
+        painter.setBrush(self._handle_brush)
+        painter.setPen(self._handle_pen)
         
         # Use float coordinates for precise handle placement (matching interaction logic)
         # rect is integer QRect, need to be careful with -1 offset of topRight/bottomRight
@@ -208,59 +336,147 @@ class ViewportRenderer:
             painter.drawEllipse(pt, handle_size, handle_size)
 
     def _draw_pivot(self, painter: QPainter, entity):
+        if not self._cull_rect.contains(QPointF(entity.pivot.x, entity.pivot.y)):
+            return
+        
         pivot_size = 10 / self.zoom
-        painter.setPen(QPen(QColor(255, 255, 0), 2 / self.zoom))
-        painter.drawLine(entity.pivot.x - pivot_size, entity.pivot.y, entity.pivot.x + pivot_size, entity.pivot.y)
-        painter.drawLine(entity.pivot.x, entity.pivot.y - pivot_size, entity.pivot.x, entity.pivot.y + pivot_size)
+        self._pivot_pen.setWidthF(2 / self.zoom)
+        painter.setPen(self._pivot_pen)
+        px, py = entity.pivot.x, entity.pivot.y
+        painter.drawLines([QLineF(px - pivot_size, py, px + pivot_size, py),
+                           QLineF(px, py - pivot_size, px, py + pivot_size)])
 
     def _draw_grid(self, painter: QPainter, view_rect: QRectF):
         grid_size = self._state.grid_size
         if grid_size <= 0:
             return
-            
-        left = int(view_rect.left())
-        right = int(view_rect.right())
-        top = int(view_rect.top())
-        bottom = int(view_rect.bottom())
         
+        transform = painter.worldTransform()
+        m11, m22, dx, dy = transform.m11(), transform.m22(), transform.dx(), transform.dy()
+        moving = (m11, m22, dx, dy) != self._grid_last_transform
+        self._grid_last_transform = (m11, m22, dx, dy)
+        
+        width, height = self.viewport_size
+        dpr = painter.device().devicePixelRatio()
+        if width <= 0 or height <= 0 or dpr != int(dpr):
+            # View size unknown, or tile offsets would land between device pixels
+            self._draw_grid_lines(painter, view_rect, grid_size)
+            return
+        
+        # The regular lines repeat every grid spacing, so the cached tile only
+        # depends on the scale and on where lines fall within a screen pixel.
+        # Panning by whole pixels (the usual mouse pan) just moves the tile.
+        spacing = self._effective_grid_size(grid_size)
+        step_x, step_y = spacing * m11, spacing * m22
+        offset_x, offset_y = dx % step_x, dy % step_y
+        pixel_x, pixel_y = math.floor(offset_x), math.floor(offset_y)
+        phase_x, phase_y = offset_x - pixel_x, offset_y - pixel_y
+        key = (spacing, m11, m22, width, height, dpr, round(phase_x * 64), round(phase_y * 64))
+        
+        if key != self._grid_tile_key:
+            if moving:
+                # Zooming (or panning at a fractional spacing): each frame
+                # would miss, so draw directly and build the tile once the view settles
+                self._draw_grid_lines(painter, view_rect, grid_size)
+                return
+            self._render_grid_tile(width, height, dpr, spacing, m11, m22, phase_x, phase_y)
+            self._grid_tile_key = key
+        
+        painter.save()
+        painter.resetTransform()
+        painter.drawPixmap(pixel_x - math.ceil(step_x), pixel_y - math.ceil(step_y), self._grid_pixmap)
+        painter.restore()
+        
+        # The origin lines don't repeat; draw them over the tile
+        self._draw_grid_origin(painter, view_rect, spacing)
+
+    def _render_grid_tile(self, width: int, height: int, dpr: float, spacing: int,
+                          m11: float, m22: float, phase_x: float, phase_y: float):
+        # One spacing larger than the screen (plus a pixel for the fractional
+        # part), with lines at phase + k * step after a one-spacing margin
+        step_x, step_y = spacing * m11, spacing * m22
+        margin_x, margin_y = math.ceil(step_x), math.ceil(step_y)
+        tile_w, tile_h = width + margin_x + 1, height + margin_y + 1
+        size = QSize(int(tile_w * dpr), int(tile_h * dpr))
+        if self._grid_pixmap is None or self._grid_pixmap.size() != size:
+            self._grid_pixmap = QPixmap(size)
+            self._grid_pixmap.setDevicePixelRatio(dpr)
+        self._grid_pixmap.fill(Qt.transparent)
+        
+        # Draw in world units through the same scale and sub-pixel offset as
+        # the view, so the lines rasterize exactly like _draw_grid_lines()
+        base_x = margin_x + phase_x - step_x
+        base_y = margin_y + phase_y - step_y
+        painter = QPainter(self._grid_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setTransform(QTransform(m11, 0, 0, m22, base_x, base_y))
+        self._stroke_grid_lines(painter, -base_x / m11, -base_y / m22,
+                                (tile_w - base_x) / m11, (tile_h - base_y) / m22, spacing)
+        painter.end()
+
+    def _effective_grid_size(self, grid_size: int) -> int:
+        # Coarsen when zoomed far out (origin lines stay, 0 is a multiple of any size)
+        screen_spacing = grid_size * self.zoom
+        while screen_spacing < self.MIN_GRID_SPACING:
+            grid_size *= 2
+            screen_spacing *= 2
+        return grid_size
+
+    def _draw_grid_lines(self, painter: QPainter, view_rect: QRectF, grid_size: int):
+        grid_size = self._effective_grid_size(grid_size)
+        
+        # Round outwards so lines fully span the (possibly partial) exposed area
+        left = math.floor(view_rect.left())
+        right = math.ceil(view_rect.right())
+        top = math.floor(view_rect.top())
+        bottom = math.ceil(view_rect.bottom())
+        
+        self._stroke_grid_lines(painter, left, top, right, bottom, grid_size)
+        self._draw_grid_origin(painter, view_rect, grid_size)
+
+    def _stroke_grid_lines(self, painter: QPainter, left: float, top: float,
+                           right: float, bottom: float, grid_size: int):
+        # Regular lines only, including the one under the origin line, so the
+        # direct path and the cached tile draw the same lines
         # Calculate steps
         start_x = (left // grid_size) * grid_size
         start_y = (top // grid_size) * grid_size
         
-        # Configuration
-        # Determine grid color based on background (assumed dark)
-        grid_color = QColor(60, 60, 60)
-        origin_color = QColor(80, 80, 80)
-        
         lines = []
-        origin_lines = []
         
         # Vertical lines
         x = start_x
         while x <= right + grid_size:
-            line = QLineF(x, top, x, bottom)
-            if x == 0:
-                origin_lines.append(line)
-            else:
-                lines.append(line)
+            lines.append(QLineF(x, top, x, bottom))
             x += grid_size
             
         # Horizontal lines
         y = start_y
         while y <= bottom + grid_size:
-            line = QLineF(left, y, right, y)
-            if y == 0:
-                origin_lines.append(line)
-            else:
-                lines.append(line)
+            lines.append(QLineF(left, y, right, y))
             y += grid_size
             
         # Draw standard grid
-        painter.setPen(QPen(grid_color, 1 / self.zoom))
+        # Grid color is based on the background (assumed dark)
+        self._grid_pen.setWidthF(1 / self.zoom)
+        painter.setPen(self._grid_pen)
         painter.drawLines(lines)
+
+    def _draw_grid_origin(self, painter: QPainter, view_rect: QRectF, grid_size: int):
+        # Origin lines (slightly brighter), where they are near the view
+        left = math.floor(view_rect.left())
+        right = math.ceil(view_rect.right())
+        top = math.floor(view_rect.top())
+        bottom = math.ceil(view_rect.bottom())
+        
+        origin_lines = []
+        if left - grid_size <= 0 <= right + grid_size:
+            origin_lines.append(QLineF(0, top, 0, bottom))
+        if top - grid_size <= 0 <= bottom + grid_size:
+            origin_lines.append(QLineF(left, 0, right, 0))
         
-        # Draw origin lines (slightly brighter)
         if origin_lines:
-            painter.setPen(QPen(origin_color, 2 / self.zoom))
+            self._grid_origin_pen.setWidthF(2 / self.zoom)
+            painter.setPen(self._grid_origin_pen)
             painter.drawLines(origin_lines)
 
@@ -87,9 +87,8 @@ class UVEditorWidget(QWidget):
     
     def _screen_to_world(self, screen_pos: QPointF) -> QPointF:
         """Convert screen coordinates to texture coordinates."""
-        center = QPointF(self.width() / 2, self.height() / 2)
-        offset_x = screen_pos.x() - center.x()
-        offset_y = screen_pos.y() - center.y()
+        offset_x = screen_pos.x() - self.width() / 2
+        offset_y = screen_pos.y() - self.height() / 2
         world_x = self._view_center.x() + offset_x / self._zoom
         world_y = self._view_center.y() + offset_y / self._zoom
         return QPointF(world_x, world_y)
@@ -205,7 +204,7 @@ class UVEditorWidget(QWidget):
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press."""
         if event.button() == Qt.LeftButton:
-            world_pos = self._screen_to_world(QPointF(event.pos()))
+            world_pos = self._screen_to_world(event.position())
             
             # Check for resize handle
             handle = self._get_resize_handle(world_pos)
@@ -230,13 +229,13 @@ class UVEditorWidget(QWidget):
         elif event.button() == Qt.MiddleButton or (event.button() == Qt.RightButton):
             # Start panning
             self._is_panning = True
-            self._pan_start_pos = QPointF(event.pos())
+            self._pan_start_pos = event.position()
             self._pan_start_view = QPointF(self._view_center)
             event.accept()
     
     def mouseMoveEvent(self, event: QMouseEvent):
         """Handle mouse move."""
-        world_pos = self._screen_to_world(QPointF(event.pos()))
+        world_pos = self._screen_to_world(event.position())
         
         if self._resizing and self._drag_start_uv_rect:
             # Resize UV rect
@@ -275,7 +274,7 @@ class UVEditorWidget(QWidget):
             
         elif self._is_panning:
             # Pan view
-            event_pos = QPointF(event.pos())
+            event_pos = event.position()
             delta_x = event_pos.x() - self._pan_start_pos.x()
             delta_y = event_pos.y() - self._pan_start_pos.y()
             self._view_center = QPointF(
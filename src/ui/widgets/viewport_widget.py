@@ -6,8 +6,8 @@ supports selection, drag-and-drop positioning, and visual feedback.
 """
 
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QPointF, QRectF, QRect, Signal, QPoint
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath, QTransform
+from PySide6.QtCore import Qt, QPointF, QRectF, QRect, Signal, QPoint, QTimer
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath
 from typing import Optional, List, Tuple
 import sys
 import os
@@ -19,6 +19,11 @@ from src.data import Entity, BodyPart, Hitbox, Vec2
 from src.rendering import get_texture_manager
 from src.core import get_signal_hub
 
+# Paint colors, allocated once instead of on every paintEvent
+_BACKGROUND_COLOR = QColor(40, 40, 40)
+_EMPTY_TEXT_COLOR = QColor(100, 100, 100)
+_OVERLAY_TEXT_COLOR = QColor(200, 200, 200)
+
 class ViewportWidget(QWidget):
     """
     Interactive 2D viewport for visualizing and editing entities.
@@ -41,9 +46,21 @@ class ViewportWidget(QWidget):
         
         # View Transform State
         self._zoom = 1.0
-        self._pan_offset = QPointF(0, 0)
         self._view_center = QPointF(0, 0)
         
+        # Pan State (plain floats captured on middle-button press)
+        self._is_panning = False
+        self._pan_start_x = 0.0
+        self._pan_start_y = 0.0
+        self._pan_start_view_x = 0.0
+        self._pan_start_view_y = 0.0
+        
+        # Repaints requested by bursts of mouse moves collapse into one
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update)
+        
         # Setup Components
         # Renderer needs state
         self._renderer = ViewportRenderer(self._state)
@@ -55,26 +72,54 @@ class ViewportWidget(QWidget):
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
         
+        # (cx, cy, view_cx, view_cy, zoom, inv_zoom) as plain floats, rebuilt by
+        # _update_transform_cache whenever zoom, pan or size change
+        self._cached_transform = (0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
+        self._update_transform_cache()
+        
         # Connect to Signals
         self._signal_hub = get_signal_hub()
         self._connect_signals()
         
     def _connect_signals(self):
-        # Repaint on any change
-        self._signal_hub.entity_loaded.connect(lambda e: self.update())
-        self._signal_hub.bodypart_selected.connect(lambda b: self.update())
-        self._signal_hub.bodyparts_selection_changed.connect(lambda b: self.update())
-        self._signal_hub.bodypart_modified.connect(lambda b: self.update())
-        self._signal_hub.bodypart_added.connect(lambda b: self.update())
-        self._signal_hub.bodypart_removed.connect(lambda b: self.update())
-        self._signal_hub.bodypart_reordered.connect(self.update)
-        self._signal_hub.hitbox_selected.connect(lambda h: self.update())
-        self._signal_hub.hitbox_modified.connect(lambda h: self.update())
-        self._signal_hub.hitbox_added.connect(lambda h: self.update())
-        self._signal_hub.hitbox_removed.connect(lambda h: self.update())
-        self._signal_hub.hitbox_edit_mode_changed.connect(lambda e: self.update())
-        self._signal_hub.snap_value_changed.connect(lambda v: self.update()) # Renderer might use this eventually
-        self._state.grid_changed.connect(lambda v, s: self.update())
+        # Any entity change (SignalHub follows every body part and hitbox
+        # notification with entity_modified) invalidates the z-sort and repaints
+        self._signal_hub.entity_loaded.connect(self._invalidate_all)
+        self._signal_hub.entity_modified.connect(self._invalidate_all)
+        
+        # Textures load in the background; placeholders are drawn until ready
+        self._signal_hub.entity_loaded.connect(self._prefetch_textures)
+        self._signal_hub.texture_loaded.connect(lambda p: self._schedule_update())
+        
+        # Repaint on any other change (skipped while hidden; Qt repaints on show)
+        self._signal_hub.bodypart_selected.connect(lambda b: self._schedule_update())
+        self._signal_hub.bodyparts_selection_changed.connect(lambda b: self._schedule_update())
+        self._signal_hub.hitbox_selected.connect(lambda h: self._schedule_update())
+        self._signal_hub.hitbox_modified.connect(lambda h: self._schedule_update())
+        self._signal_hub.hitbox_added.connect(lambda h: self._schedule_update())
+        self._signal_hub.hitbox_removed.connect(lambda h: self._schedule_update())
+        self._signal_hub.hitbox_edit_mode_changed.connect(lambda e: self._schedule_update())
+        self._signal_hub.snap_value_changed.connect(lambda v: self._schedule_update()) # Renderer might use this eventually
+        self._state.grid_changed.connect(lambda v, s: self._schedule_update())
+
+    def _update_transform_cache(self):
+        self._cached_transform = (self.width() * 0.5, self.height() * 0.5,
+                                  self._view_center.x(), self._view_center.y(),
+                                  self._zoom, 1.0 / self._zoom)
+
+    def _schedule_update(self):
+        """Request a repaint, unless the viewport is hidden or has updates disabled."""
+        if self.isVisible() and self.updatesEnabled():
+            self.update()
+
+    def _prefetch_textures(self, entity: Optional[Entity]):
+        if entity:
+            get_texture_manager().prefetch({bp.texture_path for bp in entity.body_parts if bp.texture_path})
+
+    def _invalidate_all(self, *args):
+        """Mark cached scene data as stale and schedule a single repaint."""
+        self._renderer.invalidate()
+        self._schedule_update()
 
     def set_entity(self, entity: Entity):
         """Set the entity to display."""
@@ -84,26 +129,49 @@ class ViewportWidget(QWidget):
         # Let's assume the caller has updated the state or this is just for the View.
         # In the new architecture, View just reflects State.
         # However, for transition, we trigger update.
-        self.update()
+        self._schedule_update()
 
     def get_entity(self) -> Optional[Entity]:
         return self._state.current_entity
     
+    def get_sorted_body_parts(self, descending: bool = False) -> List[BodyPart]:
+        """Body parts of the current entity in z-order, cached until the next change."""
+        entity = self._state.current_entity
+        if not entity:
+            return []
+        return self._renderer.get_sorted_body_parts(entity, descending)
+    
     def set_zoom(self, zoom: float):
         """Set viewport zoom level."""
         self._zoom = zoom
-        self.update()
+        self._update_transform_cache()
+        self._schedule_update()
+    
+    def resizeEvent(self, event):
+        self._update_transform_cache()
+        super().resizeEvent(event)
+        
+    def update_world_rect(self, rect: QRectF):
+        """Schedule a repaint of only the screen area covering a world-space rect."""
+        left, top = self._world_to_screen_xy(rect.left(), rect.top())
+        right, bottom = self._world_to_screen_xy(rect.right(), rect.bottom())
+        # Pad by a couple of pixels for antialiased edges
+        self.update(QRectF(left, top, right - left, bottom - top).toAlignedRect().adjusted(-2, -2, 2, 2))
         
     def paintEvent(self, event):
         """Render the viewport."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
+        # Only the exposed area needs redrawing (Qt already clips the painter
+        # to the update region, so this just avoids drawing what is clipped)
+        exposed = event.rect()
+        
         # Fill background
-        painter.fillRect(self.rect(), QColor(40, 40, 40))
+        painter.fillRect(exposed, _BACKGROUND_COLOR)
         
         if not self._state.current_entity:
-            painter.setPen(QColor(100, 100, 100))
+            painter.setPen(_EMPTY_TEXT_COLOR)
             painter.drawText(self.rect(), Qt.AlignCenter, "No Entity Loaded")
             return
             
@@ -111,15 +179,14 @@ class ViewportWidget(QWidget):
         painter.save()
         
         # Center view: Screen Center -> View Center
-        screen_center_x = self.width() / 2
-        screen_center_y = self.height() / 2
-        
-        painter.translate(screen_center_x, screen_center_y)
-        painter.scale(self._zoom, self._zoom)
-        painter.translate(-self._view_center.x(), -self._view_center.y())
+        cx, cy, vcx, vcy, zoom, _ = self._cached_transform
+        painter.translate(cx, cy)
+        painter.scale(zoom, zoom)
+        painter.translate(-vcx, -vcy)
         
         # Update Renderer State
         self._renderer.zoom = self._zoom
+        self._renderer.viewport_size = (self.width(), self.height())
         # Pass generic visual options if needed (or renderer reads from its own config)
         self._renderer.show_grid = True # Should match widget state or user pref
         # self._renderer.show_hitboxes = ? (Accessed via local state or we should check signal hub?)
@@ -131,12 +198,10 @@ class ViewportWidget(QWidget):
         # But we need access to the preferences. 
         # For now, let's assume default is True.
         
-        # Calculate visible world area
-        top_left = self.screen_to_world(QPointF(0, 0))
-        bottom_right = self.screen_to_world(QPointF(self.width(), self.height()))
-        view_rect = QRectF(top_left.x, top_left.y, 
-                          bottom_right.x - top_left.x, 
-                          bottom_right.y - top_left.y)
+        # Calculate exposed world area (used for culling)
+        left, top = self._screen_to_world_xy(exposed.left(), exposed.top())
+        right, bottom = self._screen_to_world_xy(exposed.right() + 1, exposed.bottom() + 1)
+        view_rect = QRectF(left, top, right - left, bottom - top)
                           
         self._renderer.render(painter, view_rect)
         
@@ -149,16 +214,19 @@ class ViewportWidget(QWidget):
         self._draw_overlay(painter)
 
     def _draw_overlay(self, painter: QPainter):
-        painter.setPen(QColor(200, 200, 200))
+        painter.setPen(_OVERLAY_TEXT_COLOR)
         painter.drawText(10, 20, f"Zoom: {self._zoom:.2f}x")
 
     # --- Input Handling ( Routed to Controller ) ---
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MiddleButton:
+            pos = event.position()
             self._is_panning = True
-            self._pan_start_pos = event.position()
-            self._pan_start_view_center = QPointF(self._view_center)
+            self._pan_start_x = pos.x()
+            self._pan_start_y = pos.y()
+            self._pan_start_view_x = self._view_center.x()
+            self._pan_start_view_y = self._view_center.y()
             self.setCursor(Qt.ClosedHandCursor)
             event.accept()
             return
@@ -166,18 +234,22 @@ class ViewportWidget(QWidget):
         self._controller.mouse_press(event)
 
     def mouseMoveEvent(self, event):
-        if hasattr(self, '_is_panning') and self._is_panning:
-            delta = event.position() - self._pan_start_pos
+        if self._is_panning:
+            pos = event.position()
+            inv_zoom = self._cached_transform[5]
             # Adjust view center based on delta (scaled by zoom)
-            self._view_center = self._pan_start_view_center - QPointF(delta.x() / self._zoom, delta.y() / self._zoom)
-            self.update()
+            self._view_center.setX(self._pan_start_view_x - (pos.x() - self._pan_start_x) * inv_zoom)
+            self._view_center.setY(self._pan_start_view_y - (pos.y() - self._pan_start_y) * inv_zoom)
+            self._update_transform_cache()
+            if not self._update_timer.isActive():
+                self._update_timer.start()
             event.accept()
             return
             
         self._controller.mouse_move(event)
 
     def mouseReleaseEvent(self, event):
-        if event.button() == Qt.MiddleButton and hasattr(self, '_is_panning'):
+        if event.button() == Qt.MiddleButton and self._is_panning:
             self._is_panning = False
             self.setCursor(Qt.ArrowCursor)
             event.accept()
@@ -188,27 +260,34 @@ class ViewportWidget(QWidget):
     def wheelEvent(self, event):
         """Handle mouse wheel for zooming."""
         zoom_inp = event.angleDelta().y()
+        if zoom_inp == 0:
+            return
+        
         old_zoom = self._zoom
         if zoom_inp > 0:
-            self._zoom *= 1.1
+            new_zoom = old_zoom * 1.1
         else:
-            self._zoom /= 1.1
+            new_zoom = old_zoom / 1.1
             
-        self._zoom = max(0.1, min(self._zoom, 10.0))
+        new_zoom = max(0.1, min(new_zoom, 10.0))
         
-        # Adjust view center to keep mouse position stable
-        mouse_pos = event.position()
-        world_pos_old = self.screen_to_world(mouse_pos, old_zoom)
+        # Already at the zoom limit: nothing to recompute or repaint
+        if new_zoom == old_zoom:
+            return
         
-        # Recalculate view center
-        screen_center_x = self.width() / 2
-        screen_center_y = self.height() / 2
+        # World position under the mouse, taken before the zoom changes
+        mouse_pos = event.position()
+        dx = mouse_pos.x() - self._cached_transform[0]
+        dy = mouse_pos.y() - self._cached_transform[1]
+        world_x, world_y = self._screen_to_world_xy(mouse_pos.x(), mouse_pos.y())
         
-        dx = mouse_pos.x() - screen_center_x
-        dy = mouse_pos.y() - screen_center_y
+        self._zoom = new_zoom
+        inv_zoom = 1.0 / new_zoom
         
-        self._view_center.setX(world_pos_old.x - (dx / self._zoom))
-        self._view_center.setY(world_pos_old.y - (dy / self._zoom))
+        # Recalculate view center to keep mouse position stable
+        self._view_center.setX(world_x - (dx * inv_zoom))
+        self._view_center.setY(world_y - (dy * inv_zoom))
+        self._update_transform_cache()
         
         self.update()
     
@@ -218,30 +297,22 @@ class ViewportWidget(QWidget):
 
     # --- Coordinate Conversion Utilities ---
 
-    def screen_to_world(self, screen_pos: QPointF, override_zoom=None) -> Vec2:
+    def _screen_to_world_xy(self, screen_x: float, screen_y: float) -> Tuple[float, float]:
+        """Convert screen coordinates to a world (x, y) tuple."""
+        cx, cy, vcx, vcy, _, inv_zoom = self._cached_transform
+        return (vcx + (screen_x - cx) * inv_zoom,
+                vcy + (screen_y - cy) * inv_zoom)
+
+    def screen_to_world(self, screen_pos: QPointF) -> Vec2:
         """Convert screen coordinates to world coordinates."""
-        zoom = override_zoom if override_zoom is not None else self._zoom
-        
-        screen_center_x = self.width() / 2
-        screen_center_y = self.height() / 2
-        
-        dx = screen_pos.x() - screen_center_x
-        dy = screen_pos.y() - screen_center_y
-        
-        world_x = self._view_center.x() + (dx / zoom)
-        world_y = self._view_center.y() + (dy / zoom)
-        
-        return Vec2(world_x, world_y)
+        return Vec2(*self._screen_to_world_xy(screen_pos.x(), screen_pos.y()))
+
+    def _world_to_screen_xy(self, world_x: float, world_y: float) -> Tuple[float, float]:
+        """Convert world coordinates to a screen (x, y) tuple."""
+        cx, cy, vcx, vcy, zoom, _ = self._cached_transform
+        return (cx + (world_x - vcx) * zoom,
+                cy + (world_y - vcy) * zoom)
 
     def world_to_screen(self, world_pos: Vec2) -> QPointF:
         """Convert world coordinates to screen coordinates."""
-        screen_center_x = self.width() / 2
-        screen_center_y = self.height() / 2
-        
-        rel_x = world_pos.x - self._view_center.x()
-        rel_y = world_pos.y - self._view_center.y()
-        
-        screen_x = screen_center_x + (rel_x * self._zoom)
-        screen_y = screen_center_y + (rel_y * self._zoom)
-        
-        return QPointF(screen_x, screen_y)
+        return QPointF(*self._world_to_screen_xy(world_pos.x, world_pos.y))
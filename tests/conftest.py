@@ -0,0 +1,33 @@
+"""
+Shared pytest configuration for Entity Editor tests.
+"""
+
+import os
+
+# The project root is put on sys.path by `pythonpath` in pytest.ini
+
+# Tests that do need Qt must not require a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+from src.data import Entity, BodyPart, Vec2
+from src.core import HistoryManager
+
+
+@pytest.fixture
+def entity():
+    """A fresh, empty entity."""
+    return Entity(name="TestEntity")
+
+
+@pytest.fixture
+def bodypart():
+    """A fresh body part (not attached to any entity)."""
+    return BodyPart(name="TestPart", position=Vec2(10, 20), size=Vec2(64, 64))
+
+
+@pytest.fixture
+def history(entity):
+    """A history manager for the entity fixture, without signal notifications."""
+    return HistoryManager(entity, signal_hub=None)